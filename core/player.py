@@ -4,6 +4,15 @@ from core.constants import *
 
 class Player:
     """Represents a player in the tournament."""
+    # Slots instead of a per-instance __dict__; the order is the field order of to_dict()
+    __slots__ = (
+        "id", "name", "rating", "phone", "email", "club", "federation", "gender", "dob",
+        "score", "is_active", "color_history", "opponent_ids", "results", "running_scores",
+        "has_received_bye", "num_black_games", "float_history", "tiebreakers",
+        "_opponents_played_cache",
+    )
+    _SERIALIZED_FIELDS = tuple(name for name in __slots__ if not name.startswith('_'))
+
     def __init__(self, name: str, rating: Optional[int] = None, player_id: Optional[str] = None,
                  phone: Optional[str] = None, email: Optional[str] = None, club: Optional[str] = None,
                  federation: Optional[str] = None, gender: Optional[str] = None, dob: Optional[str] = None) -> None:
@@ -92,7 +101,7 @@ class Player:
 
     def to_dict(self) -> Dict[str, Any]:
         """Serializes player data."""
-        data = {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+        data = {k: getattr(self, k) for k in self._SERIALIZED_FIELDS}
         return data
 
     @classmethod
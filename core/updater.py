@@ -1,8 +1,14 @@
 
-import requests
 import json
-from typing import Optional, Dict, Any
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from packaging.version import parse as parse_version
+from PyQt6 import QtCore
+from core.utils import json_loads, json_dumps
+
+if TYPE_CHECKING:
+    import requests  # Imported on first network use; it pulls in urllib3, ssl and certifi
 
 # Assuming constants.py will have this. If not, define it here.
 try:
@@ -12,34 +18,184 @@ except ImportError:
     # This makes the module more self-contained if constants change.
     UPDATE_URL = "https://api.github.com/repos/Chickaboo/UpdaterTest/releases/latest"
 
+# --- Release Cache ---
+# The last release payload is kept on disk so that repeated launches within
+# CACHE_TTL seconds don't hit the GitHub API at all.
+CACHE_TTL = 86400  # 24 hours
+
+_cache_dir = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.StandardLocation.GenericCacheLocation)
+if not _cache_dir:
+    _cache_dir = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.StandardLocation.TempLocation)
+_CACHE_PATH = Path(_cache_dir) / "UpdaterTest" / "release.json"
+
 
 class Updater:
     """Handles checking for application updates from GitHub Releases."""
 
-    def __init__(self, current_version: str):
+    def __init__(self, current_version: str, cache_ttl: int = CACHE_TTL):
         """
         Initializes the updater.
         :param current_version: The current version of the application (e.g., "0.4.0").
+        :param cache_ttl: Seconds a cached release payload is trusted before re-fetching.
         """
         self.current_version = current_version
+        # The running version never changes, so parse it once rather than on every check
+        self._current_parsed = parse_version(current_version)
+        self.cache_ttl = cache_ttl
         self.latest_version_info: Optional[Dict[str, Any]] = None
+        # Created on first network use (on the update worker thread), then reused for every
+        # GitHub call so follow-up requests skip the TCP/TLS handshake
+        self._session: Optional["requests.Session"] = None
+
+    def _get_session(self) -> "requests.Session":
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._session.headers.update({
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+                "User-Agent": f"UpdaterTest/{self.current_version}",
+                "Accept-Encoding": "gzip",
+            })
+        return self._session
+
+    def close(self) -> None:
+        """Releases the pooled HTTP connections."""
+        if self._session is not None:
+            self._session.close()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Returns the cached state from disk, or an empty dict if missing/corrupt."""
+        try:
+            cache = json_loads(_CACHE_PATH.read_bytes())
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache: Dict[str, Any]) -> None:
+        """Writes the cache atomically so a crash never leaves a half-written file."""
+        try:
+            _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _CACHE_PATH.with_suffix(".tmp")
+            tmp_path.write_bytes(json_dumps(cache))
+            tmp_path.replace(_CACHE_PATH)
+        except OSError as e:
+            print(f"Could not write update cache: {e}")
+
+    @staticmethod
+    def _trim_release(release: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Keeps only the fields the app reads (tag, notes, first asset URL).
+        The full payload lists every asset with uploader details; the trimmed copy is
+        what gets cached, so each launch parses a few hundred bytes instead of ~30KB.
+        """
+        trimmed = {key: release[key] for key in ("tag_name", "body") if key in release}
+        assets = release.get("assets")
+        if assets:
+            trimmed["assets"] = [{"browser_download_url": assets[0].get("browser_download_url")}]
+        return trimmed
+
+    @staticmethod
+    def _get_rate_limit_reset(response: "requests.Response") -> Optional[float]:
+        """
+        Returns the UNIX time until which GitHub will refuse further requests,
+        or None if the response shows quota left.
+        """
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                return float(response.headers["X-RateLimit-Reset"])
+            except (KeyError, ValueError):
+                pass
+        if response.status_code in (403, 429) and "Retry-After" in response.headers:
+            try:
+                return time.time() + float(response.headers["Retry-After"])
+            except ValueError:
+                pass
+        return None
 
-    def check_for_updates(self) -> bool:
+    def _is_newer(self) -> bool:
+        """Compares the tag of latest_version_info against the running version."""
+        # GitHub tags are often prefixed with 'v', e.g., 'v1.2.3'
+        latest_version_str = self.latest_version_info.get("tag_name", "0.0.0").lstrip('v')
+
+        # Use the packaging library for robust version comparison (handles cases like 1.0.0-beta vs 1.0.0)
+        return parse_version(latest_version_str) > self._current_parsed
+
+    def check_cached(self) -> Optional[bool]:
+        """
+        Answers the update check from the disk cache alone.
+        Returns None if GitHub hasn't been checked within cache_ttl, otherwise
+        whether the cached release is newer than the running version.
+        """
+        cache = self._load_cache()
+        release = cache.get("release")
+        if not release or time.time() - cache.get("last_checked", 0) >= self.cache_ttl:
+            return None
+        try:
+            self.latest_version_info = release
+            return self._is_newer()
+        except Exception as e:
+            print(f"Ignoring unusable update cache: {e}")
+            self.latest_version_info = None
+            return None
+
+    def check_for_updates(self, force: bool = False) -> bool:
         """
         Checks for updates by fetching the latest release from GitHub.
+        Unless force is set, a cached release younger than cache_ttl is reused instead of
+        hitting the network; otherwise the cached ETag turns the request into a cheap 304 revalidation.
         Returns True if a newer version is available, False otherwise.
         """
+        if not force:
+            cached = self.check_cached()
+            if cached is not None:
+                return cached
+
+        import requests  # Deferred until a check actually needs the network
+
         try:
-            # Use a timeout to prevent the app from hanging indefinitely
-            response = requests.get(UPDATE_URL, timeout=10)
-            response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
-            self.latest_version_info = response.json()
+            cache = self._load_cache()
+            release = cache.get("release")
+
+            # Don't spend a request while GitHub's rate limit is exhausted
+            if time.time() < cache.get("reset_at", 0):
+                self.latest_version_info = release
+                return self._is_newer() if release else False
 
-            # GitHub tags are often prefixed with 'v', e.g., 'v1.2.3'
-            latest_version_str = self.latest_version_info.get("tag_name", "0.0.0").lstrip('v')
+            headers = {}
+            # A conditional request returns 304 with an empty body if the release is unchanged
+            if release and cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+
+            # Use a timeout to prevent the app from hanging indefinitely.
+            # response.content is already gunzipped bytes, which json_loads parses without a str decode.
+            response = self._get_session().get(UPDATE_URL, headers=headers, timeout=10)
+            reset_at = self._get_rate_limit_reset(response)
+            if reset_at:
+                cache["reset_at"] = reset_at
+            if response.status_code in (403, 429) and reset_at:
+                self._save_cache(cache)
+                print(f"Update check skipped: GitHub rate limit exceeded until {time.ctime(reset_at)}")
+                # Answer from the cached release, as the reset_at early return above does
+                self.latest_version_info = release
+                return self._is_newer() if release else False
+
+            if response.status_code == 304:
+                self.latest_version_info = release
+                cache["last_checked"] = time.time()
+                self._save_cache(cache)
+                return self._is_newer()
+
+            response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
+            self.latest_version_info = json_loads(response.content)
+            cache.update({
+                "last_checked": time.time(),
+                "etag": response.headers.get("ETag"),
+                "release": self._trim_release(self.latest_version_info),
+            })
+            self._save_cache(cache)
 
-            # Use the packaging library for robust version comparison (handles cases like 1.0.0-beta vs 1.0.0)
-            return parse_version(latest_version_str) > parse_version(self.current_version)
+            return self._is_newer()
 
         except requests.RequestException as e:
             # Handle connection errors, timeouts, etc.
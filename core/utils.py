@@ -1,10 +1,18 @@
 import logging
 import sys
 import random
+import json
+from typing import Any, Union
 from PyQt6 import QtCore
 from PyQt6.QtCore import QDateTime
 from core.constants import APP_NAME
 
+# orjson is much faster than the stdlib json module; fall back if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Logging Setup ---
 # Setup logging to file and console
 log_formatter = logging.Formatter("%(asctime)s [%(levelname)-5.5s] %(message)s")
@@ -35,6 +43,32 @@ console_handler.setFormatter(log_formatter)
 root_logger.addHandler(console_handler)
 
 # --- Utility Functions ---
+# Random parts already handed out in the current millisecond, so bulk creation can't collide
+_id_msecs = 0
+_id_randoms_this_msec = set()
+
 def generate_id(prefix: str = "item_") -> str:
     """Generates a simple unique ID."""
-    return f"{prefix}{random.randint(100000, 999999)}_{int(QDateTime.currentMSecsSinceEpoch())}"
\ No newline at end of file
+    global _id_msecs
+    msecs = int(QDateTime.currentMSecsSinceEpoch())
+    if msecs != _id_msecs:
+        _id_msecs = msecs
+        _id_randoms_this_msec.clear()
+    n = random.randint(100000, 999999)
+    while n in _id_randoms_this_msec:
+        n = random.randint(100000, 999999)
+    _id_randoms_this_msec.add(n)
+    return f"{prefix}{n}_{msecs}"
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parses a JSON document (str or bytes)."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serializes obj to UTF-8 JSON bytes. Non-string dict keys are converted like the stdlib does."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
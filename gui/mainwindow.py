@@ -1,13 +1,15 @@
 from PyQt6 import QtWidgets, QtCore, QtGui
-from PyQt6.QtGui import QAction, QCloseEvent
-from PyQt6.QtCore import QDateTime, QFileInfo, Qt
-from typing import List, Tuple, Optional
+from PyQt6.QtGui import QAction, QCloseEvent, QPixmap
+from PyQt6.QtCore import QDateTime, Qt
+from typing import Dict, List, Tuple, Optional
 import logging
 import json
 from pathlib import Path
+import os
 import sys
 import webbrowser
 from core.updater import Updater
+from core.utils import json_loads, json_dumps
 
 from core.tournament import Tournament
 from core.player import Player
@@ -20,10 +22,35 @@ from gui.standings_tab import StandingsTab
 from gui.crosstable_tab import CrosstableTab
 from gui.history_tab import HistoryTab
 
+# --- Background Workers ---
+
+class UpdateCheckWorker(QtCore.QObject):
+    """Runs Updater.check_for_updates off the GUI thread and reports the result."""
+    finished = QtCore.pyqtSignal(bool)
+
+    def __init__(self, updater: Updater, force: bool = False) -> None:
+        super().__init__()
+        self.updater = updater
+        self.force = force
+
+    def run(self) -> None:
+        self.finished.emit(self.updater.check_for_updates(force=self.force))
+
+class _OpenUrlTask(QtCore.QRunnable):
+    """Opens a URL in the system browser; launching the browser can block for a noticeable time."""
+    def __init__(self, url: str) -> None:
+        super().__init__()
+        self.url = url
+
+    def run(self) -> None:
+        webbrowser.open(self.url)
+
 # --- Main Application Window ---
 
 class SwissTournamentApp(QtWidgets.QMainWindow):
     """Main application window for the Swiss Tournament."""
+    _about_pixmap: Optional[QPixmap] = None  # Scaled about.webp, decoded on first use
+
     def __init__(self) -> None:
         super().__init__()
         self.tournament: Optional[Tournament] = None
@@ -32,19 +59,41 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         self.current_round_index: int = 0
         self.last_recorded_results_data: List[Tuple[str, str, float]] = []
         self._current_filepath: Optional[str] = None
+        self._current_filename: str = ""  # Basename of _current_filepath, kept in sync by _set_filepath
         self._dirty: bool = False
+        self._ui_update_pending: bool = False
+        self._tab_status_shown: bool = False  # A tab posted a status message since the last UI refresh
         self.updater: Optional[Updater] = None
+        self._last_flags: Dict[str, bool] = {}  # Last enabled state applied to each action, see _set_enabled
+        self._update_thread: Optional[QtCore.QThread] = None
+        self._update_worker: Optional[UpdateCheckWorker] = None
+        self._update_on_finished = None  # Result handler of the running check; a manual request can take it over
 
         self._load_version()
         self._setup_ui()
         self._update_ui_state()
-        if self.updater:
-            QtCore.QTimer.singleShot(1500, self.check_for_updates_auto)
+        QtCore.QTimer.singleShot(100, self._post_startup)
+
+    def _post_startup(self):
+        """Deferred startup work: shows the About dialog, then runs the automatic update check."""
+        self.show_about_dialog()
+        # Only packaged builds check automatically; running from source never touches the network.
+        # Help > Check for Updates still works everywhere.
+        if self.updater and getattr(sys, 'frozen', False) and os.environ.get("UPDATERTEST_NO_UPDATE_CHECK") != "1":
+            self.check_for_updates_auto()
 
     def _load_version(self):
-        """Loads the application version from version.json."""
+        """Loads the application version (baked into core/_version.py for builds, else version.json)."""
         try:
             if getattr(sys, 'frozen', False):
+                try:
+                    # Generated by setup.py, so frozen launches skip reading and parsing version.json
+                    from core._version import VERSION
+                    self.current_version = VERSION
+                    self.updater = Updater(self.current_version)
+                    return
+                except ImportError:
+                    pass
                 base_path = Path(sys.executable).parent
             else:
                 base_path = Path(__file__).parent.parent
@@ -72,7 +121,6 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         self._setup_toolbar()
         self.statusBar().showMessage("Ready - Create New or Load Tournament.")
         logging.info(f"{APP_NAME} v{APP_VERSION} started.")
-        QtCore.QTimer.singleShot(100, self.show_about_dialog)
 
     def _setup_main_panel(self):
         """Creates the tab widget and populates it with the modular tab classes."""
@@ -81,25 +129,76 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
 
         self.players_tab = PlayersTab(self)
         self.tournament_tab = TournamentTab(self)
-        self.standings_tab = StandingsTab(self)
-        self.crosstable_tab = CrosstableTab(self)
         self.history_tab = HistoryTab(self)
-
-        self.players_tab.status_message.connect(self.statusBar().showMessage)
-        self.tournament_tab.status_message.connect(self.statusBar().showMessage)
+        # Standings and Cross-Table are built the first time they're needed (see _ensure_*_tab)
+        self.standings_tab: Optional[StandingsTab] = None
+        self.crosstable_tab: Optional[CrosstableTab] = None
+        self._standings_placeholder = QtWidgets.QWidget()
+        self._crosstable_placeholder = QtWidgets.QWidget()
+        self._lazy_tabs = {
+            self._standings_placeholder: self._ensure_standings_tab,
+            self._crosstable_placeholder: self._ensure_crosstable_tab,
+        }
+
+        self.players_tab.status_message.connect(self._show_tab_status)
+        self.tournament_tab.status_message.connect(self._show_tab_status)
         self.players_tab.history_message.connect(self.history_tab.update_history_log)
         self.tournament_tab.history_message.connect(self.history_tab.update_history_log)
         self.players_tab.dirty.connect(self.mark_dirty)
         self.tournament_tab.dirty.connect(self.mark_dirty)
-        self.tournament_tab.dirty.connect(self._update_ui_state)
         self.tournament_tab.round_completed.connect(self._on_round_completed)
-        self.tournament_tab.standings_update_requested.connect(self.standings_tab.update_standings_table)
 
         self.tabs.addTab(self.players_tab, "Players")
         self.tabs.addTab(self.tournament_tab, "Tournament")
-        self.tabs.addTab(self.standings_tab, "Standings")
-        self.tabs.addTab(self.crosstable_tab, "Cross-Table")
+        self.tabs.addTab(self._standings_placeholder, "Standings")
+        self.tabs.addTab(self._crosstable_placeholder, "Cross-Table")
         self.tabs.addTab(self.history_tab, "History Log")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+        # Bound set_tournament of every built tab; deferred tabs add theirs when created
+        self._tournament_setters = [tab.set_tournament for tab in (self.players_tab, self.tournament_tab, self.history_tab)
+                                    if hasattr(tab, 'set_tournament')]
+
+    def _on_tab_changed(self, index: int):
+        """Builds a deferred tab when its placeholder is activated."""
+        ensure_tab = self._lazy_tabs.get(self.tabs.widget(index))
+        if ensure_tab:
+            ensure_tab()
+
+    def _replace_placeholder(self, placeholder: QtWidgets.QWidget, tab: QtWidgets.QWidget):
+        """Swaps a placeholder page for the real tab, keeping its position, label and selection."""
+        index = self.tabs.indexOf(placeholder)
+        was_current = self.tabs.currentIndex() == index
+        label = self.tabs.tabText(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, label)
+        if was_current:
+            self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        del self._lazy_tabs[placeholder]
+        placeholder.deleteLater()
+
+    def _ensure_standings_tab(self) -> StandingsTab:
+        if self.standings_tab is None:
+            self.standings_tab = StandingsTab(self)
+            self.tournament_tab.standings_update_requested.connect(self.standings_tab.update_standings_table)
+            self.players_tab.standings_update_requested.connect(self.standings_tab.update_standings_table)
+            self._replace_placeholder(self._standings_placeholder, self.standings_tab)
+            self._tournament_setters.append(self.standings_tab.set_tournament)
+            self.standings_tab.set_tournament(self.tournament)
+            self.standings_tab.update_standings_table_headers()
+            self.standings_tab.update_standings_table()
+            self.standings_tab.update_ui_state()
+        return self.standings_tab
+
+    def _ensure_crosstable_tab(self) -> CrosstableTab:
+        if self.crosstable_tab is None:
+            self.crosstable_tab = CrosstableTab(self)
+            self._replace_placeholder(self._crosstable_placeholder, self.crosstable_tab)
+            self._tournament_setters.append(self.crosstable_tab.set_tournament)
+            self.crosstable_tab.set_tournament(self.tournament) # Also builds the table
+        return self.crosstable_tab
 
     def _setup_menu(self):
         """Sets up the main menu bar, connecting actions to methods in the main window or tabs."""
@@ -113,7 +212,7 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         self.save_as_action = self._create_action("Save Tournament &As...", lambda: self.save_tournament(save_as=True), "Ctrl+Shift+S")
         self.import_players_action = self._create_action("&Import Players from CSV...", self.players_tab.import_players_csv)
         self.export_players_action = self._create_action("&Export Players to CSV...", self.players_tab.export_players_csv)
-        self.export_standings_action = self._create_action("&Export Standings...", self.standings_tab.export_standings)
+        self.export_standings_action = self._create_action("&Export Standings...", lambda: self._ensure_standings_tab().export_standings())
         self.settings_action = self._create_action("S&ettings...", self.show_settings_dialog)
         self.exit_action = self._create_action("E&xit", self.close, "Ctrl+Q")
 
@@ -142,8 +241,8 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         view_menu = menu_bar.addMenu("&View")
         view_menu.addAction("Players", lambda: self.tabs.setCurrentWidget(self.players_tab))
         view_menu.addAction("Tournament Control", lambda: self.tabs.setCurrentWidget(self.tournament_tab))
-        view_menu.addAction("Standings", lambda: self.tabs.setCurrentWidget(self.standings_tab))
-        view_menu.addAction("Cross-Table", lambda: self.tabs.setCurrentWidget(self.crosstable_tab))
+        view_menu.addAction("Standings", lambda: self.tabs.setCurrentWidget(self._ensure_standings_tab()))
+        view_menu.addAction("Cross-Table", lambda: self.tabs.setCurrentWidget(self._ensure_crosstable_tab()))
         view_menu.addAction("History Log", lambda: self.tabs.setCurrentWidget(self.history_tab))
 
         # Help Menu
@@ -182,8 +281,12 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         toolbar.addSeparator()
         toolbar.addActions([self.start_action, self.prepare_round_action, self.record_results_action, self.undo_results_action])
 
-    def _update_ui_state(self):
-        """Updates the state of UI elements based on the tournament's current state."""
+    def _update_ui_state(self, keep_status: bool = False):
+        """
+        Updates the state of UI elements based on the tournament's current state.
+        With keep_status, the status bar is left showing whatever is there.
+        """
+        self._tab_status_shown = False
         tournament_exists = self.tournament is not None
         pairings_generated = len(self.tournament.rounds_pairings_ids) if tournament_exists else 0
         results_recorded = self.current_round_index
@@ -198,17 +301,17 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         can_undo = tournament_exists and results_recorded > 0 and bool(self.last_recorded_results_data)
 
         # Update main actions (toolbar and menu)
-        self.start_action.setEnabled(can_start)
-        self.prepare_round_action.setEnabled(can_prepare)
-        self.record_results_action.setEnabled(can_record)
-        self.undo_results_action.setEnabled(can_undo)
-        self.save_action.setEnabled(tournament_exists)
-        self.save_as_action.setEnabled(tournament_exists)
-        self.export_standings_action.setEnabled(tournament_exists and results_recorded > 0)
-        self.import_players_action.setEnabled(tournament_exists and not tournament_started)
-        self.export_players_action.setEnabled(tournament_exists and len(self.tournament.players) > 0)
-        self.add_player_action.setEnabled(not tournament_started)
-        self.settings_action.setEnabled(tournament_exists)
+        self._set_enabled(self.start_action, "start", can_start)
+        self._set_enabled(self.prepare_round_action, "prepare_round", can_prepare)
+        self._set_enabled(self.record_results_action, "record_results", can_record)
+        self._set_enabled(self.undo_results_action, "undo_results", can_undo)
+        self._set_enabled(self.save_action, "save", tournament_exists)
+        self._set_enabled(self.save_as_action, "save_as", tournament_exists)
+        self._set_enabled(self.export_standings_action, "export_standings", tournament_exists and results_recorded > 0)
+        self._set_enabled(self.import_players_action, "import_players", tournament_exists and not tournament_started)
+        self._set_enabled(self.export_players_action, "export_players", tournament_exists and len(self.tournament.players) > 0)
+        self._set_enabled(self.add_player_action, "add_player", not tournament_started)
+        self._set_enabled(self.settings_action, "settings", tournament_exists)
 
         # Do NOT disable the Players tab after tournament starts
         # self.tabs.setTabEnabled(self.tabs.indexOf(self.players_tab), not tournament_started)
@@ -216,17 +319,20 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         # Delegate UI state updates to the tabs themselves
         self.players_tab.update_ui_state()
         self.tournament_tab.update_ui_state()
-        self.standings_tab.update_ui_state()
-        self.crosstable_tab.update_ui_state()
+        if self.standings_tab is not None:
+            self.standings_tab.update_ui_state()
+        if self.crosstable_tab is not None:
+            self.crosstable_tab.update_ui_state()
         self.history_tab.update_ui_state()
 
         # Update window title
         title = APP_NAME
-        if self._current_filepath:
-            title += f" - {QFileInfo(self._current_filepath).fileName()}"
+        if self._current_filename:
+            title += f" - {self._current_filename}"
         if self._dirty:
             title += "*"
-        self.setWindowTitle(title)
+        if self.windowTitle() != title:
+            self.setWindowTitle(title)
         
         # Update status bar
         status = "Ready"
@@ -241,21 +347,50 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
                 status = f"Tournament finished. Final standings are available."
             else:
                 status = f"Tournament in progress. Completed rounds: {results_recorded}/{total_rounds}."
-        self.statusBar().showMessage(status)
+        if not keep_status and self.statusBar().currentMessage() != status:
+            self.statusBar().showMessage(status)
+
+    def _set_enabled(self, action: QAction, key: str, enabled: bool):
+        """Calls setEnabled only when the value changes, so Qt doesn't re-emit changed() for no-ops."""
+        if self._last_flags.get(key) != enabled:
+            action.setEnabled(enabled)
+            self._last_flags[key] = enabled
+
+    def _set_filepath(self, filepath: Optional[str]):
+        self._current_filepath = filepath
+        self._current_filename = Path(filepath).name if filepath else ""
+
+    def _schedule_ui_update(self):
+        """Coalesces bursts of refresh requests into a single _update_ui_state on the next event-loop pass."""
+        if not self._ui_update_pending:
+            self._ui_update_pending = True
+            QtCore.QTimer.singleShot(0, self._run_ui_update)
+
+    def _run_ui_update(self):
+        self._ui_update_pending = False
+        # A tab's own message (e.g. "Round 1 pairings ready") posted around the deferred
+        # request is more specific than the generic state text, so it is kept
+        self._update_ui_state(keep_status=self._tab_status_shown)
+
+    def _show_tab_status(self, message: str):
+        self.statusBar().showMessage(message)
+        self._tab_status_shown = True
 
     def mark_dirty(self, dirty=True):
-        if self._dirty != dirty:
-            self._dirty = dirty
-            self._update_ui_state()
+        # Edits arrive in bursts (several dirty signals per action), so the refresh is deferred
+        self._dirty = dirty
+        self._schedule_ui_update()
 
     def mark_clean(self):
-        self.mark_dirty(False)
+        # Refreshed immediately so the caller's own status message (e.g. "saved") isn't overwritten later
+        if self._dirty:
+            self._dirty = False
+            self._update_ui_state()
 
     def _set_tournament_on_tabs(self):
         """Passes the current tournament object to all tabs so they can access its data."""
-        for tab in [self.players_tab, self.tournament_tab, self.standings_tab, self.crosstable_tab, self.history_tab]:
-            if hasattr(tab, 'set_tournament'):
-                tab.set_tournament(self.tournament)
+        for set_tournament in self._tournament_setters:
+            set_tournament(self.tournament)
         # Also set current_round_index on tournament_tab if method exists
         if hasattr(self.tournament_tab, 'set_current_round_index'):
             self.tournament_tab.set_current_round_index(self.current_round_index)
@@ -267,17 +402,19 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         self.tournament = None
         self.current_round_index = 0
         self.last_recorded_results_data = []
-        self._current_filepath = None
+        self._set_filepath(None)
         self.mark_clean()
         
         self._set_tournament_on_tabs() # Pass None to clear tabs
         
         # Explicitly clear UI elements in tabs
-        self.players_tab.list_players.clear()
+        self.players_tab.refresh_player_list()
         self.tournament_tab.table_pairings.setRowCount(0)
         self.tournament_tab.lbl_bye.setText("Bye: None")
-        self.standings_tab.table_standings.setRowCount(0)
-        self.crosstable_tab.table_crosstable.setRowCount(0)
+        if self.standings_tab is not None:
+            self.standings_tab.table_standings.setRowCount(0)
+        if self.crosstable_tab is not None:
+            self.crosstable_tab.table_crosstable.setRowCount(0)
         self.history_tab.history_view.clear()
         
         self._update_ui_state()
@@ -291,7 +428,7 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         # Propagate the new round index to the tournament_tab
         if hasattr(self.tournament_tab, 'set_current_round_index'):
             self.tournament_tab.set_current_round_index(new_round_index)
-        self._update_ui_state()
+        self.mark_dirty()
 
     def prompt_new_tournament(self):
         if not self.check_save_before_proceeding():
@@ -304,7 +441,8 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
             self.update_history_log(f"--- New Tournament Created (Rounds: {self.tournament.num_rounds}) ---")
             self.mark_dirty()
             self._set_tournament_on_tabs()
-            self.standings_tab.update_standings_table_headers()
+            if self.standings_tab is not None:
+                self.standings_tab.update_standings_table_headers()
         else:
             self.reset_tournament_state()
         
@@ -329,8 +467,9 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
                 self.tournament.tiebreak_order = new_tiebreaks
                 self.update_history_log(f"Tiebreak order updated.")
                 self.mark_dirty()
-                self.standings_tab.update_standings_table_headers()
-                self.standings_tab.update_standings_table()
+                if self.standings_tab is not None:
+                    self.standings_tab.update_standings_table_headers()
+                    self.standings_tab.update_standings_table()
 
             self._update_ui_state()
             return True
@@ -345,7 +484,7 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         if not self._current_filepath or save_as:
             filename, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save Tournament", "", "JSON Files (*.json)")
             if not filename: return False
-            self._current_filepath = filename
+            self._set_filepath(filename)
         
         try:
             data = self.tournament.to_dict()
@@ -353,11 +492,13 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
                 'current_round_index': self.current_round_index,
                 'last_recorded_results_data': self.last_recorded_results_data
             }
-            with open(self._current_filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            # Serialize fully before opening the file so an encoding error can't truncate an existing save
+            payload = json_dumps(data, indent=True)
+            with open(self._current_filepath, 'wb') as f:
+                f.write(payload)
             self.mark_clean()
             self.statusBar().showMessage(f"Tournament saved to {self._current_filepath}")
-            self.update_history_log(f"--- Tournament saved to {QFileInfo(self._current_filepath).fileName()} ---")
+            self.update_history_log(f"--- Tournament saved to {self._current_filename} ---")
             return True
         except Exception as e:
             logging.exception("Error saving tournament:")
@@ -370,8 +511,8 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         if not filename: return
 
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                data = json_loads(f.read())
             
             self.reset_tournament_state()
             self.tournament = Tournament.from_dict(data)
@@ -379,19 +520,21 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
             gui_state = data.get('gui_state', {})
             self.current_round_index = gui_state.get('current_round_index', 0)
             self.last_recorded_results_data = gui_state.get('last_recorded_results_data', [])
-            self._current_filepath = filename
+            self._set_filepath(filename)
             
             self._set_tournament_on_tabs()
             
             # Refresh all views
             self.players_tab.refresh_player_list()
-            self.standings_tab.update_standings_table_headers()
-            self.standings_tab.update_standings_table()
-            self.crosstable_tab.update_crosstable()
+            if self.standings_tab is not None:
+                self.standings_tab.update_standings_table_headers()
+                self.standings_tab.update_standings_table()
+            if self.crosstable_tab is not None:
+                self.crosstable_tab.update_crosstable()
             self.tournament_tab.display_pairings_for_input() # Display current round
             
             self.mark_clean()
-            self.update_history_log(f"--- Tournament loaded from {QFileInfo(filename).fileName()} ---")
+            self.update_history_log(f"--- Tournament loaded from {self._current_filename} ---")
             self.statusBar().showMessage(f"Loaded tournament: {self.tournament.name}")
 
         except Exception as e:
@@ -414,36 +557,46 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
 
     def show_about_dialog(self):
         """Show the About dialog with app info and about.webp image."""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton
-        from PyQt6.QtGui import QPixmap
-        import os
-        dialog = QDialog(self)
+        dialog = QtWidgets.QDialog(self)
         dialog.setWindowTitle(f"About {APP_NAME}")
-        layout = QVBoxLayout(dialog)
+        layout = QtWidgets.QVBoxLayout(dialog)
         # Add about.webp image
-        image_path = os.path.join(os.path.dirname(__file__), "about.webp")
-        if os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                img_label = QLabel()
-                img_label.setPixmap(pixmap.scaledToWidth(220))
-                img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                layout.addWidget(img_label)
+        pixmap = self._get_about_pixmap()
+        if not pixmap.isNull():
+            img_label = QtWidgets.QLabel()
+            img_label.setPixmap(pixmap)
+            img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(img_label)
         # Add app info text
-        info_label = QLabel(f"<b>{APP_NAME} v{APP_VERSION}</b><br>\nSwiss Tournament Manager\n<br>Copyright \u00A9 2025\n<br>Developed by Chickaboo\n<br><br>For help, join the <a href=\"https://discord.gg/eEnnetMDfr\">Discord</a> or contact <a href=\"https://www.chickaboo.net/contact\">support</a>.")
+        info_label = QtWidgets.QLabel(f"<b>{APP_NAME} v{APP_VERSION}</b><br>\nSwiss Tournament Manager\n<br>Copyright \u00A9 2025\n<br>Developed by Chickaboo\n<br><br>For help, join the <a href=\"https://discord.gg/eEnnetMDfr\">Discord</a> or contact <a href=\"https://www.chickaboo.net/contact\">support</a>.")
         info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         info_label.setOpenExternalLinks(True)  # <-- Add this line
         layout.addWidget(info_label)
         # OK button
-        ok_btn = QPushButton("OK")
+        ok_btn = QtWidgets.QPushButton("OK")
         ok_btn.clicked.connect(dialog.accept)
         layout.addWidget(ok_btn)
         dialog.setLayout(layout)
         dialog.exec()
 
+    @classmethod
+    def _get_about_pixmap(cls) -> QPixmap:
+        """Decodes and scales about.webp once; a null pixmap is cached if the image is missing."""
+        if cls._about_pixmap is None:
+            pixmap = QPixmap(os.path.join(os.path.dirname(__file__), "about.webp"))
+            cls._about_pixmap = pixmap.scaledToWidth(220) if not pixmap.isNull() else pixmap
+        return cls._about_pixmap
+
     def closeEvent(self, event: QCloseEvent):
         if self.check_save_before_proceeding():
             logging.info(f"{APP_NAME} closing.")
+            self.players_tab.cancel_import()
+            if self._update_thread:
+                # Let a pending update check finish so the thread isn't destroyed while running
+                self._update_thread.quit()
+                self._update_thread.wait()
+            if self.updater:
+                self.updater.close()
             event.accept()
         else:
             event.ignore()
@@ -454,20 +607,71 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "Update Check", "The update checker is not configured.")
             return
 
+        if not self._start_update_check(self._on_manual_update_checked, force=True):
+            # A background check is already running; report its result to the user instead
+            self._update_on_finished = self._on_manual_update_checked
         self.statusBar().showMessage("Checking for updates...")
-        has_update = self.updater.check_for_updates()
+
+    def check_for_updates_auto(self):
+        """Automatically checks for updates in the background, at most once a day."""
+        if not self.updater:
+            return
+
+        # GitHub was already asked within the last day; decide from the cached release
+        has_update = self.updater.check_cached()
+        if has_update is not None:
+            if has_update:
+                self.prompt_update()
+            return
+
+        self._start_update_check(self._on_auto_update_checked)
+
+    def _start_update_check(self, on_finished, force: bool = False) -> bool:
+        """
+        Runs the update check on a worker thread; on_finished receives the result on the GUI thread.
+        Returns False if a check is already in progress.
+        """
+        if self._update_thread is not None:
+            return False
+
+        self._update_on_finished = on_finished
+        thread = QtCore.QThread(self)
+        worker = UpdateCheckWorker(self.updater, force)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_update_checked)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_update_thread_finished)
+
+        self._update_thread = thread
+        self._update_worker = worker
+        thread.start()
+        return True
+
+    @QtCore.pyqtSlot()
+    def _on_update_thread_finished(self):
+        self._update_thread = None
+        self._update_worker = None
+
+    @QtCore.pyqtSlot(bool)
+    def _on_update_checked(self, has_update: bool):
+        on_finished, self._update_on_finished = self._update_on_finished, None
+        if on_finished:
+            on_finished(has_update)
+
+    @QtCore.pyqtSlot(bool)
+    def _on_manual_update_checked(self, has_update: bool):
         if has_update:
             self.prompt_update()
         else:
             self.statusBar().showMessage("No new updates available.")
             QtWidgets.QMessageBox.information(self, "Update Check", f"You are using the latest version of {APP_NAME} ({self.current_version}).")
 
-    def check_for_updates_auto(self):
-        """Automatically checks for updates in the background."""
-        if not self.updater:
-            return
-        
-        if self.updater.check_for_updates():
+    @QtCore.pyqtSlot(bool)
+    def _on_auto_update_checked(self, has_update: bool):
+        if has_update:
             self.prompt_update()
 
     def prompt_update(self):
@@ -475,9 +679,12 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         if not self.updater or not self.updater.latest_version_info:
             return
 
-        latest_version = self.updater.get_latest_version()
-        release_notes = self.updater.get_release_notes()
-        download_url = self.updater.get_download_url()
+        # Read the release payload once instead of going through the three Updater getters
+        info = self.updater.latest_version_info
+        latest_version = info.get("tag_name", "").lstrip('v')
+        release_notes = info.get("body", "No description available.")
+        assets = info.get("assets") or []
+        download_url = assets[0].get("browser_download_url") if assets else None
 
         if not all([latest_version, release_notes, download_url]):
             QtWidgets.QMessageBox.warning(self, "Update Error", "Could not retrieve complete update information.")
@@ -499,10 +706,4 @@ class SwissTournamentApp(QtWidgets.QMainWindow):
         msg_box.exec()
 
         if msg_box.clickedButton() == download_button:
-            webbrowser.open(download_url)
-
-    def _on_round_completed(self, round_index: int):
-        """Slot called when a round is recorded and the tournament is advanced."""
-        self.current_round_index = round_index
-        self.mark_dirty()
-        self._update_ui_state()
\ No newline at end of file
+            QtCore.QThreadPool.globalInstance().start(_OpenUrlTask(download_url))
\ No newline at end of file
@@ -4,9 +4,241 @@ from core.player import Player
 from core.tournament import Tournament
 from core.constants import DEFAULT_TIEBREAK_SORT_ORDER
 from gui.dialogs import PlayerDetailDialog
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple
 import csv
+import itertools
 import logging
+import operator
+
+# (attribute, label) pairs shown in a player's tooltip when set
+_PLAYER_TOOLTIP_FIELDS = (
+    ("gender", "Gender"),
+    ("dob", "Date of Birth"),
+    ("phone", "Phone"),
+    ("email", "Email"),
+    ("club", "Club"),
+    ("federation", "Federation"),
+)
+
+def _render_player(player: Player) -> Tuple[str, str, str, str, bool]:
+    """Builds the list row for a player: (player_id, name, display text, tooltip, is_active)."""
+    display_text = f"{player.name} ({player.rating})"
+    parts = [f"ID: {player.id}"]
+    if player.is_active:
+        parts.append("Status: Active")
+    else:
+        display_text += " (Inactive)"
+        parts.append("Status: Inactive")
+    parts.extend(f"{label}: {value}" for attr, label in _PLAYER_TOOLTIP_FIELDS if (value := getattr(player, attr)))
+    return player.id, player.name, display_text, "\n".join(parts), player.is_active
+
+# Qt enum members bound once, so the per-row model code avoids repeated attribute chains
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_TOOLTIP_ROLE = Qt.ItemDataRole.ToolTipRole
+_FG_ROLE = Qt.ItemDataRole.ForegroundRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+_ROW_ROLES = [_DISPLAY_ROLE, _TOOLTIP_ROLE, _FG_ROLE]  # Roles that change when a row is re-rendered
+_MB_YES = QtWidgets.QMessageBox.StandardButton.Yes
+_MB_NO = QtWidgets.QMessageBox.StandardButton.No
+_MB_OK = QtWidgets.QMessageBox.StandardButton.Ok
+_MB_CANCEL = QtWidgets.QMessageBox.StandardButton.Cancel
+
+class PlayersModel(QtCore.QAbstractListModel):
+    """
+    List model for the player roster. Rows are stored as parallel lists (id, name, display
+    text, tooltip, active flag) rather than one item object per player; the view only asks for
+    the rows it actually paints.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids: List[str] = []
+        self._names: List[str] = []  # Sort keys
+        self._display: List[str] = []
+        self._tooltips: List[str] = []
+        self._active: List[bool] = []
+        self._row_by_id: Dict[str, int] = {}  # player_id -> row, so edits don't scan the list
+        self._gray = QtGui.QColor("gray")
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index: QtCore.QModelIndex, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == _DISPLAY_ROLE:
+            return self._display[row]
+        if role == _TOOLTIP_ROLE:
+            return self._tooltips[row]
+        if role == _FG_ROLE:
+            return None if self._active[row] else self._gray
+        if role == _USER_ROLE:
+            return self._ids[row]
+        return None
+
+    def row_of(self, player_id: str) -> Optional[int]:
+        return self._row_by_id.get(player_id)
+
+    def append_rows(self, rows: List[Tuple[str, str, str, str, bool]]):
+        """Appends (player_id, name, display, tooltip, active) rows with a single insert notification."""
+        if not rows:
+            return
+        first = len(self._ids)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        for player_id, name, display, tooltip, active in rows:
+            self._row_by_id[player_id] = len(self._ids)
+            self._ids.append(player_id)
+            self._names.append(name)
+            self._display.append(display)
+            self._tooltips.append(tooltip)
+            self._active.append(active)
+        self.endInsertRows()
+
+    def set_row(self, row: int, name: str, display: str, tooltip: str, active: bool):
+        self._names[row] = name
+        self._display[row] = display
+        self._tooltips[row] = tooltip
+        self._active[row] = active
+        index = self.index(row)
+        self.dataChanged.emit(index, index, _ROW_ROLES)
+
+    def remove_row(self, row: int):
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._ids[row]
+        del self._names[row]
+        del self._display[row]
+        del self._tooltips[row]
+        del self._active[row]
+        # Rows after the removed one shift up; rebuilding once is cheaper than scanning on every edit
+        self._row_by_id = {player_id: i for i, player_id in enumerate(self._ids)}
+        self.endRemoveRows()
+
+    def remove_rows(self, rows: List[int]):
+        """Removes the given rows, with one remove notification per contiguous run."""
+        # Walk bottom-up so earlier runs keep their row numbers; row + position is constant within a run
+        for _, run in itertools.groupby(enumerate(sorted(set(rows), reverse=True)), key=lambda p: p[0] + p[1]):
+            run = [row for _, row in run]
+            first, last = run[-1], run[0]
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._ids[first:last + 1]
+            del self._names[first:last + 1]
+            del self._display[first:last + 1]
+            del self._tooltips[first:last + 1]
+            del self._active[first:last + 1]
+            self.endRemoveRows()
+        self._row_by_id = {player_id: i for i, player_id in enumerate(self._ids)}
+
+    def clear(self):
+        self.beginResetModel()
+        self._ids.clear()
+        self._names.clear()
+        self._display.clear()
+        self._tooltips.clear()
+        self._active.clear()
+        self._row_by_id.clear()
+        self.endResetModel()
+
+    def reset_from_tournament(self, tournament: Optional[Tournament]):
+        """Replaces every row with the tournament's players, sorted by name, in one model reset."""
+        self.beginResetModel()
+        rows = [_render_player(p) for p in tournament.players.values()] if tournament else []
+        self._ids, self._names, self._display, self._tooltips, self._active = (
+            (list(column) for column in zip(*rows)) if rows else ([], [], [], [], []))
+        self._permute(self._name_order())
+        self.endResetModel()
+
+    def _name_order(self) -> List[int]:
+        return sorted(range(len(self._names)), key=self._names.__getitem__)
+
+    def _permute(self, perm: List[int]):
+        """Reorders the row columns so that new row n holds old row perm[n]."""
+        self._ids = [self._ids[i] for i in perm]
+        self._names = [self._names[i] for i in perm]
+        self._display = [self._display[i] for i in perm]
+        self._tooltips = [self._tooltips[i] for i in perm]
+        self._active = [self._active[i] for i in perm]
+        self._row_by_id = {player_id: i for i, player_id in enumerate(self._ids)}
+
+    def sort_by_name(self):
+        """Reorders the rows by player name in place, with one layout change instead of a reset."""
+        perm = self._name_order()
+        if all(i == row for row, i in enumerate(perm)):
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._permute(perm)
+        # Keep selection and current index on the same players
+        new_row = [0] * len(perm)
+        for row, i in enumerate(perm):
+            new_row[i] = row
+        old = self.persistentIndexList()
+        self.changePersistentIndexList(old, [self.index(new_row[index.row()]) for index in old])
+        self.layoutChanged.emit()
+
+# Columns read by the CSV import, in the order CSVImportWorker emits them
+_IMPORT_COLUMNS = ("Name", "Rating", "Gender", "Date of Birth", "Phone", "Email", "Club", "Federation")
+
+class CSVImportWorker(QtCore.QObject):
+    """
+    Reads a player CSV off the GUI thread. Rows are handed back as tuples ordered like
+    _IMPORT_COLUMNS (None for a missing column or cell), in chunks so the GUI thread
+    can apply them between repaints.
+    """
+    chunk_ready = pyqtSignal(list)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+    CHUNK_SIZE = 500
+
+    def __init__(self, filename: str) -> None:
+        super().__init__()
+        self.filename = filename
+        self._cancelled = False  # Set from the GUI thread; checked between chunks
+
+    def cancel(self) -> None:
+        """Asks run() to stop after the current chunk."""
+        self._cancelled = True
+
+    def run(self) -> None:
+        try:
+            # Text mode with newline="" lets csv see \n, \r\n and lone \r line endings alike
+            with open(self.filename, "r", encoding="utf-8", newline="") as f:
+                rows_read = self._read_rows(f)
+            self.finished.emit(rows_read)
+        except Exception as e:
+            logging.exception("Error importing players:")
+            self.failed.emit(str(e))
+
+    def _read_rows(self, lines) -> int:
+        """Parses CSV lines and emits them in chunks; returns the number of rows read."""
+        reader = csv.reader(lines)
+        header = next(reader, None)
+        if header is None:
+            return 0
+        # Rows are cut to the header and padded to one past it, so absent columns read
+        # that None slot (extra cells are dropped, as DictReader filed them under restkey)
+        n = len(header)
+        width = n + 1
+        idx = {h: i for i, h in enumerate(header)}
+        pick = operator.itemgetter(*(idx.get(c, n) for c in _IMPORT_COLUMNS))
+        pad = [None] * width
+        rows_read = 0
+        buf = []
+        append = buf.append
+        for row in reader:
+            if len(row) > n:
+                del row[n:]
+            row += pad[len(row):]
+            append(pick(row))
+            if len(buf) >= self.CHUNK_SIZE:
+                rows_read += len(buf)
+                self.chunk_ready.emit(buf)
+                buf = []  # The emitted list now belongs to the receiver
+                append = buf.append
+                if self._cancelled:
+                    return rows_read
+        if buf:
+            rows_read += len(buf)
+            self.chunk_ready.emit(buf)
+        return rows_read
 
 class PlayersTab(QtWidgets.QWidget):
     status_message = pyqtSignal(str)
@@ -18,12 +250,27 @@ class PlayersTab(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.tournament = None  # This should be set by the main window
+        self._names_casefold: Set[str] = set()  # Casefolded player names, for O(1) duplicate checks
+        self._import_thread: Optional[QtCore.QThread] = None
+        self._import_worker: Optional[CSVImportWorker] = None
+        self._import_tournament: Optional[Tournament] = None
+        self._import_filename = ""
+        self._import_added = 0
+        self._import_stopped = False  # Set when the tournament started mid-import
+        # Coalesces bursts of standings requests into one emit; start() restarts a pending shot
+        self._standings_timer = QtCore.QTimer(self)
+        self._standings_timer.setSingleShot(True)
+        self._standings_timer.setInterval(30)
+        self._standings_timer.timeout.connect(self.standings_update_requested.emit)
         self.main_layout = QtWidgets.QVBoxLayout(self)
         player_group = QtWidgets.QGroupBox("Players")
         player_group.setToolTip("Manage players. Right-click list items for actions.")
         player_group_layout = QtWidgets.QVBoxLayout(player_group)
-        self.list_players = QtWidgets.QListWidget()
+        self._model = PlayersModel(self)
+        self.list_players = QtWidgets.QListView()
+        self.list_players.setModel(self._model)
         self.list_players.setToolTip("Registered players. Right-click to Edit/Withdraw/Reactivate/Remove.")
+        self.list_players.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
         self.list_players.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.list_players.customContextMenuRequested.connect(self.on_player_context_menu)
         self.list_players.setAlternatingRowColors(True)
@@ -34,29 +281,38 @@ class PlayersTab(QtWidgets.QWidget):
         player_group_layout.addWidget(self.btn_add_player_detail)
         self.main_layout.addWidget(player_group)
 
+        # Player context menu, built once; on_player_context_menu only updates text and state
+        self._ctx_menu = QtWidgets.QMenu(self)
+        self._act_edit = self._ctx_menu.addAction("Edit Player Details...")
+        self._act_withdraw = self._ctx_menu.addAction("Withdraw Player")
+        self._act_remove = self._ctx_menu.addAction("Remove Player")
+        self._act_remove_selected = self._ctx_menu.addAction("Remove Selected")
+
     def on_player_context_menu(self, point: QtCore.QPoint) -> None:
-        item = self.list_players.itemAt(point)
-        if not item or not self.tournament: return
-        player_id = item.data(Qt.ItemDataRole.UserRole)
+        index = self.list_players.indexAt(point)
+        if not index.isValid() or not self.tournament: return
+        player_id = index.data(_USER_ROLE)
         player = self.tournament.players.get(player_id)
         if not player: return
 
-        # Tournament started if pairings for R1 (index 0) exist.
-        tournament_started = len(self.tournament.rounds_pairings_ids) > 0
+        tournament_started = self._tournament_started()
 
-        menu = QtWidgets.QMenu(self)
-        edit_action = menu.addAction("Edit Player Details...")
+        edit_action, withdraw_action = self._act_edit, self._act_withdraw
+        remove_action, remove_selected_action = self._act_remove, self._act_remove_selected
         # Withdraw/Reactivate action text depends on player's current state
-        withdraw_action_text = "Withdraw Player" if player.is_active else "Reactivate Player"
-        withdraw_action = menu.addAction(withdraw_action_text)
-        remove_action = menu.addAction("Remove Player")
+        withdraw_action.setText("Withdraw Player" if player.is_active else "Reactivate Player")
+        # Ids rather than rows: an import finishing during exec() or a dialog may re-sort the list
+        selected_ids = [i.data(_USER_ROLE) for i in self.list_players.selectionModel().selectedRows()]
+        remove_selected_action.setVisible(len(selected_ids) > 1)
+        remove_selected_action.setText(f"Remove Selected ({len(selected_ids)})")
 
         edit_action.setEnabled(not tournament_started) 
         remove_action.setEnabled(not tournament_started) 
+        remove_selected_action.setEnabled(not tournament_started)
         # Withdraw/Reactivate should be possible anytime, affecting future pairings/bye eligibility.
         withdraw_action.setEnabled(True) 
 
-        action = menu.exec(self.list_players.mapToGlobal(point))
+        action = self._ctx_menu.exec(self.list_players.mapToGlobal(point))
 
         if action == edit_action:
             dialog = PlayerDetailDialog(self, player_data=player.to_dict())
@@ -66,10 +322,13 @@ class PlayersTab(QtWidgets.QWidget):
                     QtWidgets.QMessageBox.warning(self, "Edit Error", "Player name cannot be empty.")
                     return
                 # Check for duplicate name (only if name changed and it's not the current player's ID)
-                if data['name'] != player.name and any(p.name == data['name'] for p in self.tournament.players.values()):
+                new_key, old_key = data['name'].casefold(), player.name.casefold()
+                if new_key != old_key and new_key in self._names_casefold:
                      QtWidgets.QMessageBox.warning(self, "Edit Error", f"Another player named '{data['name']}' already exists.")
                      return
                 
+                self._names_casefold.discard(old_key)
+                self._names_casefold.add(new_key)
                 player.name = data['name']
                 player.rating = data['rating']
                 player.gender = data.get('gender')
@@ -79,46 +338,63 @@ class PlayersTab(QtWidgets.QWidget):
                 player.club = data.get('club')
                 player.federation = data.get('federation')
                 
-                self.update_player_list_item(player) # Helper to update QListWidgetItem
+                self.update_player_list_item(player) # Helper to update the player's row
                 self.history_message.emit(f"Player '{player.name}' details updated.")
                 self.dirty.emit()
         elif action == withdraw_action:
              player.is_active = not player.is_active
+             self.update_player_list_item(player) # The model's dataChanged repaints the row
              status_log_msg = "Withdrawn" if not player.is_active else "Reactivated"
-             self.update_player_list_item(player)
              self.history_message.emit(f"Player '{player.name}' {status_log_msg}.")
              self.dirty.emit()
-             self.standings_update_requested.emit() # Reflects active status if standings show inactive
-             self.update_ui_state() # UI might depend on active player count
+             self._request_standings() # Reflects active status if standings show inactive
 
         elif action == remove_action:
-             reply = QtWidgets.QMessageBox.question(self, "Remove Player", f"Remove player '{player.name}' permanently?",
-                                                 QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
-                                                 QtWidgets.QMessageBox.StandardButton.No)
-             if reply == QtWidgets.QMessageBox.StandardButton.Yes:
+             reply = QtWidgets.QMessageBox.question(self, "Remove Player", f"Remove player '{player.name}' permanently?", _MB_YES | _MB_NO, _MB_NO)
+             if reply == _MB_YES:
                   # Remove from tournament data
                   if player.id in self.tournament.players:
                        del self.tournament.players[player.id]
+                       self._names_casefold.discard(player.name.casefold())
                        self.history_message.emit(f"Player '{player.name}' removed from tournament.")
                   # Remove from UI list
-                  self.list_players.takeItem(self.list_players.row(item))
-                  self.parent().statusBar().showMessage(f"Player '{player.name}' removed.")
+                  row = self._model.row_of(player.id)
+                  if row is not None:
+                       self._model.remove_row(row)
+                  self.status_message.emit(f"Player '{player.name}' removed.")
              # No need to handle No, as dialog will be closed
 
+        elif action == remove_selected_action:
+             self.remove_players(selected_ids)
+
         # Update the UI state after any context menu action
         self.update_ui_state()
 
+    def remove_players(self, player_ids: List[str]):
+        """Removes the given players after a single confirmation."""
+        reply = QtWidgets.QMessageBox.question(self, "Remove Players", f"Remove {len(player_ids)} selected players permanently?", _MB_YES | _MB_NO, _MB_NO)
+        if reply != _MB_YES or not self.tournament:
+            return
+        players = self.tournament.players
+        removed = [players.pop(player_id) for player_id in player_ids if player_id in players]
+        for player in removed:
+            self._names_casefold.discard(player.name.casefold())
+        # Rows are resolved only now, after the modal dialog, so they match the current order
+        rows = [row for row in map(self._model.row_of, player_ids) if row is not None]
+        self._model.remove_rows(rows)
+        self.history_message.emit(f"Removed {len(removed)} players from tournament.")
+        self.status_message.emit(f"{len(removed)} players removed.")
+        self.dirty.emit()
+
     def add_player_detailed(self):
-        tournament_started = self.tournament and len(self.tournament.rounds_pairings_ids) > 0
-        if tournament_started:
+        if self._tournament_started():
             QtWidgets.QMessageBox.warning(self, "Tournament Active", "Cannot add players after the tournament has started.")
             return
         if not self.tournament:
             # If adding player before "New Tournament" is fully confirmed via settings
             reply = QtWidgets.QMessageBox.information(self, "New Tournament", 
-                                                  "A new tournament will be created with default settings. You can change settings later via File > Settings.",
-                                                  QtWidgets.QMessageBox.StandardButton.Ok | QtWidgets.QMessageBox.StandardButton.Cancel)
-            if reply == QtWidgets.QMessageBox.StandardButton.Cancel:
+                                                  "A new tournament will be created with default settings. You can change settings later via File > Settings.", _MB_OK | _MB_CANCEL)
+            if reply == _MB_CANCEL:
                 return
             self.request_reset_tournament.emit() # Clear any previous partial state
             return  # Wait for main window to reset and set tournament, then user can retry add
@@ -129,7 +405,7 @@ class PlayersTab(QtWidgets.QWidget):
             if not data['name']:
                 QtWidgets.QMessageBox.warning(self, "Validation Error", "Player name cannot be empty.")
                 return
-            if any(p.name == data['name'] for p in self.tournament.players.values()):
+            if data['name'].casefold() in self._names_casefold:
                 QtWidgets.QMessageBox.warning(self, "Duplicate Player", f"Player '{data['name']}' already exists.")
                 return
             new_player = Player(
@@ -143,6 +419,7 @@ class PlayersTab(QtWidgets.QWidget):
                 dob=data.get('dob')
             )
             self.tournament.players[new_player.id] = new_player
+            self._names_casefold.add(new_player.name.casefold())
             self.add_player_to_list_widget(new_player)
             self.status_message.emit(f"Added player: {new_player.name}")
             self.history_message.emit(f"Player '{new_player.name}' ({new_player.rating}) added.")
@@ -150,55 +427,21 @@ class PlayersTab(QtWidgets.QWidget):
             self.update_ui_state()
 
     def update_player_list_item(self, player: Player):
-        """Finds and updates the QListWidgetItem for a given player."""
-        for i in range(self.list_players.count()):
-            item = self.list_players.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == player.id:
-                display_text = f"{player.name} ({player.rating})"
-                tooltip_parts = [f"ID: {player.id}"]
-                if not player.is_active:
-                    display_text += " (Inactive)"
-                    tooltip_parts.append("Status: Inactive")
-                else:
-                    tooltip_parts.append("Status: Active")
-
-                if player.gender: tooltip_parts.append(f"Gender: {player.gender}")
-                if player.dob: tooltip_parts.append(f"Date of Birth: {player.dob}")
-                if player.phone: tooltip_parts.append(f"Phone: {player.phone}")
-                if player.email: tooltip_parts.append(f"Email: {player.email}")
-                if player.club: tooltip_parts.append(f"Club: {player.club}")
-                if player.federation: tooltip_parts.append(f"Federation: {player.federation}")
-                
-                item.setText(display_text)
-                item.setToolTip("\n".join(tooltip_parts))
-                item.setForeground(QtGui.QColor("gray") if not player.is_active else self.list_players.palette().color(QtGui.QPalette.ColorRole.Text))
-                break
+        """Finds and updates the list row for a given player."""
+        row = self._model.row_of(player.id)
+        if row is None:
+            return
+        self._model.set_row(row, *_render_player(player)[1:])
 
     def add_player_to_list_widget(self, player: Player):
-         display_text = f"{player.name} ({player.rating})"
-         tooltip_parts = [f"ID: {player.id}"]
-         if not player.is_active:
-             display_text += " (Inactive)"
-             tooltip_parts.append("Status: Inactive")
-         else:
-            tooltip_parts.append("Status: Active")
-
-         if player.gender: tooltip_parts.append(f"Gender: {player.gender}")
-         if player.dob: tooltip_parts.append(f"Date of Birth: {player.dob}")
-         if player.phone: tooltip_parts.append(f"Phone: {player.phone}")
-         if player.email: tooltip_parts.append(f"Email: {player.email}")
-         if player.club: tooltip_parts.append(f"Club: {player.club}")
-         if player.federation: tooltip_parts.append(f"Federation: {player.federation}")
-
-         list_item = QtWidgets.QListWidgetItem(display_text)
-         list_item.setData(Qt.ItemDataRole.UserRole, player.id)
-         list_item.setToolTip("\n".join(tooltip_parts))
-         if not player.is_active:
-              list_item.setForeground(QtGui.QColor("gray"))
-         self.list_players.addItem(list_item)
+        self.add_players_to_list_widget([player])
+
+    def add_players_to_list_widget(self, players: List[Player]):
+        """Appends rows for the given players in one model insertion."""
+        self._model.append_rows([_render_player(player) for player in players])
 
     def import_players_csv(self):
-        if self.tournament and len(self.tournament.rounds_pairings_ids) > 0:
+        if self._tournament_started():
             QtWidgets.QMessageBox.warning(self, "Import Error", "Cannot import players after tournament has started.")
             return
         if not self.tournament:
@@ -206,44 +449,132 @@ class PlayersTab(QtWidgets.QWidget):
             return
         self._pending_import = False  # Clear flag if tournament exists
 
+        if self._import_thread is not None:
+            QtWidgets.QMessageBox.information(self, "Import in Progress", "Another player import is still running.")
+            return
+
         filename, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Import Players", "", "CSV Files (*.csv);;Text Files (*.txt)")
         if not filename:
             return
-        import csv
-        try:
-            with open(filename, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                added = 0
-                for row in reader:
-                    name = row.get("Name")
-                    if not name:
-                        continue
-                    rating = row.get("Rating")
-                    try:
-                        rating = int(rating) if rating else None
-                    except Exception:
-                        rating = None
-                    player = Player(
-                        name=name,
-                        rating=rating,
-                        gender=row.get("Gender"),
-                        dob=row.get("Date of Birth"),
-                        phone=row.get("Phone"),
-                        email=row.get("Email"),
-                        club=row.get("Club"),
-                        federation=row.get("Federation")
-                    )
-                    self.tournament.players[player.id] = player
-                    added += 1
-            self.history_message.emit(f"Imported {added} players from {filename}.")
+
+        # Parsing runs on a worker thread; rows come back in chunks via _on_import_chunk
+        self._import_tournament = self.tournament
+        self._import_filename = filename
+        self._import_added = 0
+        self._import_stopped = False
+        thread = QtCore.QThread(self)
+        worker = CSVImportWorker(filename)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.chunk_ready.connect(self._on_import_chunk)
+        worker.finished.connect(self._on_import_finished)
+        worker.failed.connect(self._on_import_failed)
+        for done in (worker.finished, worker.failed):
+            done.connect(thread.quit)
+            done.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_import_thread_finished)
+
+        self._import_thread = thread
+        self._import_worker = worker
+        self.status_message.emit(f"Importing players from {filename}...")
+        thread.start()
+
+    @QtCore.pyqtSlot(list)
+    def _on_import_chunk(self, rows: list):
+        """Creates players for one chunk of CSV rows and appends them to the list."""
+        if not self._import_target_current():
+            # The tournament was replaced while the file was being read; stop reading it
+            if self._import_worker is not None:
+                self._import_worker.cancel()
+            return
+        if self._tournament_started():
+            # Pairings were made while the file was being read; no players may join now
+            if not self._import_stopped:
+                self._import_stopped = True
+                self._import_worker.cancel()
+            return
+        names = self._names_casefold
+        add_name = names.add
+        make_player = Player
+        new_players = []
+        append = new_players.append
+        for name, rating, gender, dob, phone, email, club, federation in rows:
+            if not name:
+                continue
+            key = name.casefold()
+            if key in names:
+                continue  # Skip duplicates before building a Player
+            add_name(key)
+            try:
+                rating = int(rating) if rating else None
+            except Exception:
+                rating = None
+            append(make_player(
+                name=name,
+                rating=rating,
+                gender=gender,
+                dob=dob,
+                phone=phone,
+                email=email,
+                club=club,
+                federation=federation
+            ))
+        self.tournament.players.update((p.id, p) for p in new_players)
+        self.add_players_to_list_widget(new_players)
+        self._import_added += len(new_players)
+
+    @QtCore.pyqtSlot(int)
+    def _on_import_finished(self, rows_read: int):
+        if not self._import_target_current():
+            return  # Nothing to report into a replaced tournament
+        added, filename = self._import_added, self._import_filename
+        if added:
+            self.dirty.emit()
+        self._model.sort_by_name() # Restore name order after the chunks were appended
+        self.update_ui_state()
+        if self._import_stopped:
+            self.history_message.emit(f"Imported {added} players from {filename} before the tournament started.")
+            QtWidgets.QMessageBox.warning(self, "Import Stopped", f"The tournament started during the import; "
+                                          f"only {added} players from {filename} were added.")
+            return
+        summary = f"Imported {added} players from {filename}."
+        skipped = rows_read - added
+        if skipped:
+            summary += f" Skipped {skipped} rows with a missing or duplicate name."
+        self.history_message.emit(summary)
+        QtWidgets.QMessageBox.information(self, "Import Successful", summary)
+
+    @QtCore.pyqtSlot(str)
+    def _on_import_failed(self, error: str):
+        if not self._import_target_current():
+            return
+        if self._import_added:
             self.dirty.emit()
             self.refresh_player_list()
-            self.update_ui_state()
-            QtWidgets.QMessageBox.information(self, "Import Successful", f"Imported {added} players from {filename}.")
-        except Exception as e:
-            import logging
-            logging.exception("Error importing players:")
-            QtWidgets.QMessageBox.critical(self, "Import Error", f"Could not import players:\n{e}")
+        self.update_ui_state()
+        QtWidgets.QMessageBox.critical(self, "Import Error", f"Could not import players:\n{error}")
+
+    def _import_target_current(self) -> bool:
+        """True while the tournament being imported into is still the tab's tournament."""
+        return self.tournament is not None and self.tournament is self._import_tournament
+
+    @QtCore.pyqtSlot()
+    def _on_import_thread_finished(self):
+        self._import_thread = None
+        self._import_worker = None
+        self._import_tournament = None
+
+    def cancel_import(self):
+        """Stops a running CSV import and waits for its thread, e.g. before the window closes."""
+        thread, worker = self._import_thread, self._import_worker
+        if thread is None:
+            return
+        self._import_tournament = None  # Results still queued for this tab are dropped
+        worker.cancel()
+        thread.quit()  # Queued finished->quit can't be delivered while this thread waits
+        thread.wait()
+        self._on_import_thread_finished()
 
     def export_players_csv(self):
         if not self.tournament or not self.tournament.players:
@@ -254,45 +585,50 @@ class PlayersTab(QtWidgets.QWidget):
         try:
             is_csv = selected_filter.startswith("CSV")
             delimiter = "," if is_csv else "\t"
-            with open(filename, "w", encoding="utf-8", newline='') as f:
+            with open(filename, "w", encoding="utf-8", newline='', buffering=1 << 20) as f:
                 writer = csv.writer(f, delimiter=delimiter)
                 writer.writerow(["Name", "Rating", "Gender", "Date of Birth", "Phone", "Email", "Club", "Federation", "Active", "ID"]) # Added ID
-                for player in sorted(list(self.tournament.players.values()), key=lambda p: p.name): # Sort by name
-                    writer.writerow([
-                        player.name,
-                        player.rating if player.rating is not None else "",
-                        player.gender or "",
-                        player.dob or "",
-                        player.phone or "",
-                        player.email or "",
-                        player.club or "",
-                        player.federation or "",
-                        "Yes" if player.is_active else "No",
-                        player.id
-                    ])
+                # One writerows call over a generator lets the C writer pull rows itself
+                writer.writerows((
+                    player.name,
+                    player.rating if player.rating is not None else "",
+                    player.gender or "",
+                    player.dob or "",
+                    player.phone or "",
+                    player.email or "",
+                    player.club or "",
+                    player.federation or "",
+                    "Yes" if player.is_active else "No",
+                    player.id
+                ) for player in sorted(self.tournament.players.values(), key=lambda p: p.name)) # Sort by name
             QtWidgets.QMessageBox.information(self, "Export Successful", f"Players exported to {filename}")
-            self.parent().statusBar().showMessage(f"Players exported to {filename}")
+            self.status_message.emit(f"Players exported to {filename}")
         except Exception as e:
             logging.exception("Error exporting players:")
             QtWidgets.QMessageBox.critical(self, "Export Error", f"Could not export players:\n{e}")
-            self.statusBar().showMessage("Error exporting players.")
+            self.status_message.emit("Error exporting players.")
             
     def set_tournament(self, tournament):
         self.tournament = tournament
+        self._rebuild_name_index()
         # Optionally refresh the player list here
 
+    def _rebuild_name_index(self):
+        players = self.tournament.players.values() if self.tournament else ()
+        self._names_casefold = {p.name.casefold() for p in players}
+
     def update_ui_state(self):
-        # Disable Add New Player button if no tournament exists
-        if not self.tournament:
-            self.btn_add_player_detail.setEnabled(False)
-        else:
-            # Enable only if tournament has not started
-            tournament_started = len(self.tournament.rounds_pairings_ids) > 0
-            self.btn_add_player_detail.setEnabled(not tournament_started)
+        # Enable Add New Player only if a tournament exists and has not started
+        self.btn_add_player_detail.setEnabled(self.tournament is not None and not self._tournament_started())
+
+    def _request_standings(self):
+        self._standings_timer.start()
+
+    def _tournament_started(self) -> bool:
+        """Tournament started if pairings for R1 (index 0) exist."""
+        t = self.tournament
+        return bool(t and t.rounds_pairings_ids)
 
     def refresh_player_list(self):
-        self.list_players.clear()
-        if not self.tournament or not self.tournament.players:
-            return
-        for player in sorted(self.tournament.players.values(), key=lambda p: p.name):
-            self.add_player_to_list_widget(player)
+        self._rebuild_name_index()
+        self._model.reset_from_tournament(self.tournament)
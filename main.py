@@ -2,7 +2,6 @@ import sys
 from PyQt6 import QtWidgets
 from gui.mainwindow import SwissTournamentApp
 import logging
-import requests
 
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
@@ -13,12 +12,12 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Could not load stylesheet: {e}")
     try: 
-        # Try to apply a modern style if available
-        available_styles = QtWidgets.QStyleFactory.keys()
-        if "Fusion" in available_styles:
-            app.setStyle("WindowsVista")
-        elif "WindowsVista" in available_styles and sys.platform == "win32": # Windows specific
+        # Try to apply a modern style if available: native on Windows, Fusion elsewhere
+        available_styles = set(QtWidgets.QStyleFactory.keys())
+        if sys.platform == "win32" and "WindowsVista" in available_styles: # Windows specific
             app.setStyle("WindowsVista")
+        elif "Fusion" in available_styles:
+            app.setStyle("Fusion")
         # Add other preferred styles if needed
     except Exception as e: 
         logging.warning(f"Could not set preferred application style: {e}")
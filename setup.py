@@ -1,6 +1,13 @@
 import sys
+import json
 from cx_Freeze import setup, Executable
 
+# Bake the version into core/_version.py so the frozen app doesn't read version.json at startup
+with open("version.json", "r", encoding="utf-8") as f:
+    version = json.load(f)["version"]
+with open("core/_version.py", "w", encoding="utf-8") as f:
+    f.write(f'# Generated by setup.py from version.json - do not edit.\nVERSION = "{version}"\n')
+
 # GUI vs console base
 base = "Win32GUI" if sys.platform == "win32" else None
 